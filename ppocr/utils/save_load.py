@@ -12,17 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import errno
+import io
 import os
 import pickle
-import six
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import paddle
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+# the read path targets the io_uring()/io_uring_cqe() interface of
+# liburing<2026; the 2026 PyPI releases dropped those names, so treat
+# them like the bindings being absent
+if liburing is not None and not hasattr(liburing, 'io_uring'):
+    liburing = None
+
+# chunk size and queue depth for the io_uring read path
+_URING_CHUNK = 16 * 1024 * 1024
+_URING_DEPTH = 64
+
 from ppocr.utils.logging import get_logger
 
 __all__ = ['init_model', 'save_model', 'load_dygraph_params']
@@ -44,6 +61,160 @@ def _mkdir_if_not_exist(path, logger):
                 raise OSError('Failed to mkdir {}'.format(path))
 
 
+CheckpointProbe = namedtuple(
+    'CheckpointProbe', ['pdparams', 'pdopt', 'states', 'exists', 'is_dir'])
+
+
+def _probe(prefix):
+    """
+    check the checkpoint prefix and its suffixes with one directory scan;
+    repeated os.path.exists calls cost a metadata round trip each on
+    networked filesystems
+    """
+    dirname = os.path.dirname(prefix) or '.'
+    base = os.path.basename(prefix)
+    names = set()
+    is_dir = False
+    try:
+        with os.scandir(dirname) as it:
+            for entry in it:
+                if entry.name.startswith(base):
+                    names.add(entry.name)
+                    if entry.name == base:
+                        is_dir = entry.is_dir()
+    except OSError:
+        pass
+    return CheckpointProbe(base + '.pdparams' in names,
+                           base + '.pdopt' in names,
+                           base + '.states' in names, base in names, is_dir)
+
+
+def _uring_read_many(paths):
+    """
+    read several files through one io_uring, so all their chunk requests
+    share a single submission queue and keep the NVMe queue full instead
+    of issuing one blocking read at a time
+    """
+    bufs = []
+    fds = []
+    chunks = []
+    try:
+        for path in paths:
+            size = os.path.getsize(path)
+            bufs.append(bytearray(size))
+            fds.append(os.open(path, os.O_RDONLY))
+            for offset in range(0, size, _URING_CHUNK):
+                chunks.append((len(fds) - 1, offset,
+                               min(_URING_CHUNK, size - offset)))
+        views = [memoryview(buf) for buf in bufs]
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(_URING_DEPTH, ring, 0)
+        try:
+            cqe = liburing.io_uring_cqe()
+            total = sum(length for _, _, length in chunks)
+            completed = 0
+            next_chunk = 0
+            pending = 0
+            while next_chunk < len(chunks) or pending > 0:
+                while next_chunk < len(chunks) and pending < _URING_DEPTH:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    if sqe is None:
+                        break
+                    idx, offset, length = chunks[next_chunk]
+                    liburing.io_uring_prep_read(
+                        sqe, fds[idx], views[idx][offset:offset + length],
+                        length, offset)
+                    next_chunk += 1
+                    pending += 1
+                liburing.io_uring_submit(ring)
+                liburing.io_uring_wait_cqe(ring, cqe)
+                liburing.trap_error(cqe.res)
+                completed += cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+                pending -= 1
+            # io_uring may legitimately complete a read short even on
+            # regular files; a shortfall would leave zero-filled holes
+            # in the buffers, so refuse it and let callers fall back
+            if completed != total:
+                raise OSError('short io_uring read: got {} of {} bytes '
+                              'from {}'.format(completed, total, paths))
+        finally:
+            liburing.io_uring_queue_exit(ring)
+    finally:
+        for fd in fds:
+            os.close(fd)
+    return bufs
+
+
+def _uring_read(path):
+    return _uring_read_many([path])[0]
+
+
+def _batch_read_checkpoint(prefix, probe):
+    """
+    pull a checkpoint's .pdparams/.pdopt/.states into memory with one
+    io_uring batch; returns None when the fast path is unavailable
+    """
+    if liburing is None:
+        return None
+    suffixes = ['.pdparams', '.pdopt']
+    if probe.states:
+        suffixes.append('.states')
+    try:
+        bufs = _uring_read_many([prefix + s for s in suffixes])
+    except (OSError, AttributeError, TypeError):
+        return None
+    return dict(zip(suffixes, bufs))
+
+
+def _load_tensor_file(path):
+    """
+    paddle.load with an io_uring fast path when liburing (<2026) is
+    installed
+    """
+    if liburing is None:
+        return paddle.load(path)
+    try:
+        data = _uring_read(path)
+    except (OSError, AttributeError, TypeError):
+        return paddle.load(path)
+    return paddle.load(io.BytesIO(data))
+
+
+def _save_states(path, states):
+    """
+    serialize the metric/epoch metadata dict, preferring msgpack over pickle
+    """
+    with open(path, 'wb') as f:
+        if msgpack is not None:
+            f.write(msgpack.packb(states, use_bin_type=True))
+        else:
+            pickle.dump(states, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_states(data):
+    """
+    decode the metric/epoch metadata dict, falling back to legacy pickle
+    """
+    if msgpack is not None:
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except Exception:
+            pass
+    elif not data.startswith(b'\x80'):
+        # pickle payloads always begin with the PROTO opcode, so this
+        # file must have been written with msgpack in the environment
+        raise ValueError('this .states file was written with msgpack; '
+                         'install msgpack to read it')
+    return pickle.loads(data)
+
+
+def _load_states(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return _decode_states(data)
+
+
 def init_model(config, model, optimizer=None, lr_scheduler=None):
     """
     load model from checkpoint or pretrained_model
@@ -54,20 +225,39 @@ def init_model(config, model, optimizer=None, lr_scheduler=None):
     pretrained_model = global_config.get('pretrained_model')
     best_model_dict = {}
     if checkpoints:
-        assert os.path.exists(checkpoints + ".pdparams"), \
+        probe = _probe(checkpoints)
+        assert probe.pdparams, \
             "Given dir {}.pdparams not exist.".format(checkpoints)
-        assert os.path.exists(checkpoints + ".pdopt"), \
-            "Given dir {}.pdopt not exist.".format(checkpoints)
-        para_dict = paddle.load(checkpoints + '.pdparams')
-        opti_dict = paddle.load(checkpoints + '.pdopt')
-        model.set_state_dict(para_dict)
+        states_dict = None
         if optimizer is not None:
-            optimizer.set_state_dict(opti_dict)
+            assert probe.pdopt, \
+                "Given dir {}.pdopt not exist.".format(checkpoints)
+            blobs = _batch_read_checkpoint(checkpoints, probe)
+            if blobs is not None:
+                # all three files arrived from one io_uring submission
+                model.set_state_dict(paddle.load(io.BytesIO(blobs[
+                    '.pdparams'])))
+                optimizer.set_state_dict(
+                    paddle.load(io.BytesIO(blobs['.pdopt'])))
+                if '.states' in blobs:
+                    states_dict = _decode_states(blobs['.states'])
+            else:
+                # read the optimizer state in the background: the GIL is
+                # released inside paddle's C++ loader, so the .pdopt read
+                # hides behind the .pdparams decode and set_state_dict
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    opti_future = executor.submit(paddle.load,
+                                                  checkpoints + '.pdopt')
+                    para_dict = _load_tensor_file(checkpoints + '.pdparams')
+                    model.set_state_dict(para_dict)
+                    optimizer.set_state_dict(opti_future.result())
+        else:
+            para_dict = _load_tensor_file(checkpoints + '.pdparams')
+            model.set_state_dict(para_dict)
 
-        if os.path.exists(checkpoints + '.states'):
-            with open(checkpoints + '.states', 'rb') as f:
-                states_dict = pickle.load(f) if six.PY2 else pickle.load(
-                    f, encoding='latin1')
+        if states_dict is None and probe.states:
+            states_dict = _load_states(checkpoints + '.states')
+        if states_dict is not None:
             best_model_dict = states_dict.get('best_model_dict', {})
             if 'epoch' in states_dict:
                 best_model_dict['start_epoch'] = states_dict['epoch'] + 1
@@ -76,11 +266,11 @@ def init_model(config, model, optimizer=None, lr_scheduler=None):
         if not isinstance(pretrained_model, list):
             pretrained_model = [pretrained_model]
         for pretrained in pretrained_model:
-            if not (os.path.isdir(pretrained) or
-                    os.path.exists(pretrained + '.pdparams')):
+            pre_probe = _probe(pretrained)
+            if not (pre_probe.is_dir or pre_probe.pdparams):
                 raise ValueError("Model pretrain path {} does not "
                                  "exists.".format(pretrained))
-            param_state_dict = paddle.load(pretrained + '.pdparams')
+            param_state_dict = _load_tensor_file(pretrained + '.pdparams')
             model.set_state_dict(param_state_dict)
             logger.info("load pretrained model from {}".format(
                 pretrained_model))
@@ -91,27 +281,30 @@ def init_model(config, model, optimizer=None, lr_scheduler=None):
 
 def load_dygraph_params(config, model, logger, optimizer):
     ckp = config['Global']['checkpoints']
-    if ckp and os.path.exists(ckp + ".pdparams"):
+    if ckp and _probe(ckp).pdparams:
         pre_best_model_dict = init_model(config, model, optimizer)
         return pre_best_model_dict
     else:
         pm = config['Global']['pretrained_model']
         if pm is None:
             return {}
-        if not os.path.exists(pm) and not os.path.exists(pm + ".pdparams"):
+        pm_probe = _probe(pm)
+        if not pm_probe.exists and not pm_probe.pdparams:
             logger.info(f"The pretrained_model {pm} does not exists!")
             return {}
         pm = pm if pm.endswith('.pdparams') else pm + '.pdparams'
-        params = paddle.load(pm)
+        params = _load_tensor_file(pm)
         state_dict = model.state_dict()
-        new_state_dict = {}
-        for k1, k2 in zip(state_dict.keys(), params.keys()):
-            if list(state_dict[k1].shape) == list(params[k2].shape):
-                new_state_dict[k1] = params[k2]
-            else:
-                logger.info(
-                    f"The shape of model params {k1} {state_dict[k1].shape} not matched with loaded params {k2} {params[k2].shape} !"
-                )
+        shapes = {k: tuple(v.shape) for k, v in state_dict.items()}
+        common = shapes.keys() & params.keys()
+        new_state_dict = {
+            k: params[k]
+            for k in common if shapes[k] == tuple(params[k].shape)
+        }
+        for k in sorted(common - new_state_dict.keys()):
+            logger.info(
+                f"The shape of model params {k} {shapes[k]} not matched with loaded params {k} {params[k].shape} !"
+            )
         model.set_state_dict(new_state_dict)
         logger.info(f"loaded pretrained_model successful from {pm}")
         return {}
@@ -120,21 +313,34 @@ def load_dygraph_params(config, model, logger, optimizer):
 def load_pretrained_params(model, path):
     if path is None:
         return False
-    if not os.path.exists(path) and not os.path.exists(path + ".pdparams"):
+    path_probe = _probe(path)
+    if not path_probe.exists and not path_probe.pdparams:
         print(f"The pretrained_model {path} does not exists!")
         return False
 
     path = path if path.endswith('.pdparams') else path + '.pdparams'
-    params = paddle.load(path)
+    params = _load_tensor_file(path)
     state_dict = model.state_dict()
-    new_state_dict = {}
-    for k1, k2 in zip(state_dict.keys(), params.keys()):
-        if list(state_dict[k1].shape) == list(params[k2].shape):
-            new_state_dict[k1] = params[k2]
-        else:
-            print(
-                f"The shape of model params {k1} {state_dict[k1].shape} not matched with loaded params {k2} {params[k2].shape} !"
-            )
+    # snapshot dtype/shape as primitives so the merge below does plain
+    # dict lookups instead of repeated pybind tensor attribute access
+    meta = {k: (v.dtype, tuple(v.shape)) for k, v in state_dict.items()}
+    common = params.keys() & meta.keys()
+    missing = params.keys() - meta.keys()
+    if missing:
+        print(f"The loaded params {sorted(missing)} not in model, ignored!")
+    mismatched = {
+        k
+        for k in common if tuple(params[k].shape) != meta[k][1]
+    }
+    for k in sorted(mismatched):
+        print(
+            f"The shape of model params {k} {meta[k][1]} not matched with loaded params {k} {params[k].shape} !"
+        )
+    matched = common - mismatched
+    convert_keys = [k for k in matched if params[k].dtype != meta[k][0]]
+    for k in convert_keys:
+        params[k] = params[k].astype(meta[k][0])
+    new_state_dict = {k: params[k] for k in matched}
     model.set_state_dict(new_state_dict)
     print(f"load pretrain successful from {path}")
     return model
@@ -152,12 +358,22 @@ def save_model(model,
     """
     _mkdir_if_not_exist(model_path, logger)
     model_prefix = os.path.join(model_path, prefix)
-    paddle.save(model.state_dict(), model_prefix + '.pdparams')
-    paddle.save(optimizer.state_dict(), model_prefix + '.pdopt')
+    # the two state files are independent, so overlap their writes
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(paddle.save,
+                            model.state_dict(), model_prefix + '.pdparams',
+                            protocol=4),
+            executor.submit(paddle.save,
+                            optimizer.state_dict(), model_prefix + '.pdopt',
+                            protocol=4)
+        ]
+        for future in futures:
+            future.result()
 
     # save metric and config
-    with open(model_prefix + '.states', 'wb') as f:
-        pickle.dump(kwargs, f, protocol=2)
+    if kwargs:
+        _save_states(model_prefix + '.states', kwargs)
     if is_best:
         logger.info('save best model is to {}'.format(model_prefix))
     else: